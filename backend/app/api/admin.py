@@ -0,0 +1,26 @@
+import os
+import signal
+
+from fastapi import APIRouter, Depends
+
+from app.api.auth import require_admin
+from app.config import settings
+from app.services.drain import drain
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+
+@router.post("/drain", status_code=202)
+async def start_drain() -> dict:
+    if settings.launcher_pid is not None:
+        # Under `app.serve` this request reached just one worker; have the
+        # launcher SIGTERM all of them so every worker drains and reports not-ready.
+        os.kill(settings.launcher_pid, signal.SIGTERM)
+    else:
+        drain.start()
+    return {
+        "status": "draining",
+        "scope": "launcher" if settings.launcher_pid is not None else "process",
+        "active_sessions": drain.active_sessions,
+        "grace_period_s": drain.grace_period_s,
+    }
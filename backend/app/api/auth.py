@@ -0,0 +1,14 @@
+import hmac
+
+from fastapi import Header, HTTPException
+
+from app.config import settings
+
+
+def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Admin endpoints disabled (set CR_ADMIN_TOKEN)")
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), settings.admin_token.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
 from app.database import AsyncSessionMaker
+from app.services.drain import drain
 
 router = APIRouter()
 
@@ -11,6 +13,13 @@ async def health() -> dict:
     return {"status": "ok"}
 
 
+@router.get("/health/ready")
+async def health_ready() -> JSONResponse:
+    if drain.draining:
+        return JSONResponse(status_code=503, content={"status": "draining"})
+    return JSONResponse(content={"status": "ok", "active_sessions": drain.active_sessions})
+
+
 @router.get("/health/db")
 async def health_db() -> dict:
     async with AsyncSessionMaker() as db:
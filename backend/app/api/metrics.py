@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+from app.services.metrics import collect
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def metrics() -> dict:
+    return await collect()
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.api.auth import require_admin
+from app.database import AsyncSessionMaker
+from app.schemas.search import SearchHitOut, SearchResponse
+from app.services.search import MAX_PAGE_SIZE, SearchError, search_conversations
+
+# Results expose transcript text across all conversations.
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/search/conversations", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=512),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+) -> SearchResponse:
+    async with AsyncSessionMaker() as db:
+        try:
+            page = await search_conversations(db, q, limit=limit, cursor=cursor)
+        except SearchError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return SearchResponse(
+        query=q,
+        results=[
+            SearchHitOut(
+                conversation_id=hit.conversation_id,
+                message_id=hit.message_id,
+                role=hit.role,
+                rank=hit.rank,
+                snippet=hit.snippet,
+            )
+            for hit in page.hits
+        ],
+        next_cursor=page.next_cursor,
+    )
@@ -11,6 +11,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import AsyncSessionMaker
 from app.models.conversation import Conversation
 from app.models.message import Message
+from app.services.drain import DRAIN_CLOSE_CODE, drain, draining_event
+from app.services.inbound import SessionInbox
+from app.services.metrics import stats
+from app.services.recorder import start_recording
 from app.services.relay import Relay
 from app.services.llm import LLMError, get_llm
 
@@ -33,9 +37,39 @@ async def ws_audio(websocket: WebSocket) -> None:
         db_conversation_id=conversation_uuid,
     )
 
+    if drain.draining:
+        await relay.send_event(draining_event())
+        await websocket.close(code=DRAIN_CLOSE_CODE)
+        return
+
+    relay.recording = await start_recording(conversation_id)
+    drain.register(relay)
+    stats.sessions_started += 1
+    try:
+        await _serve_session(relay, conversation_uuid)
+    finally:
+        drain.unregister(relay)
+        # Nobody is left to stream to; don't let the answer outlive the session.
+        task = relay.get_assistant_task()
+        if task is not None:
+            task.cancel()
+        if relay.recording is not None:
+            await relay.recording.close()
+
+
+async def _serve_session(relay: Relay, conversation_uuid: UUID) -> None:
+    conversation_id = relay.conversation_id
+
     async with AsyncSessionMaker() as db:
         started_at = datetime.now(timezone.utc)
-        db.add(Conversation(id=conversation_uuid, started_at=started_at, ended_at=None))
+        db.add(
+            Conversation(
+                id=conversation_uuid,
+                started_at=started_at,
+                ended_at=None,
+                recording_path=str(relay.recording.path) if relay.recording else None,
+            )
+        )
         await db.commit()
 
         await relay.send_event(
@@ -46,43 +80,108 @@ async def ws_audio(websocket: WebSocket) -> None:
             }
         )
 
-        try:
-            while True:
-                message = await websocket.receive()
+        inbox = SessionInbox.from_settings()
+        reader = asyncio.create_task(_read_loop(relay, inbox))
+        audio_worker = asyncio.create_task(_audio_worker(relay, inbox))
+        control_worker = asyncio.create_task(_control_worker(relay, db, inbox))
+        done, _ = await asyncio.wait(
+            {reader, audio_worker, control_worker}, return_when=asyncio.FIRST_COMPLETED
+        )
+
+        # Let an in-flight control event finish its DB work, but skip anything still queued.
+        reader.cancel()
+        audio_worker.cancel()
+        inbox.control.clear()
+        inbox.control.offer(None)
+        await asyncio.gather(reader, audio_worker, control_worker, return_exceptions=True)
+
+        if inbox.audio.dropped or inbox.control.dropped:
+            logger.warning(
+                "inbound overflow",
+                extra=relay.log_fields(
+                    "inbound.overflow",
+                    audio_dropped=inbox.audio.dropped,
+                    control_dropped=inbox.control.dropped,
+                ),
+            )
 
-                if message.get("text") is not None:
-                    await _handle_text_message(relay, db, message["text"])
-                    continue
+        ended_at = datetime.now(timezone.utc)
+        convo = await db.get(Conversation, conversation_uuid)
+        if convo is not None:
+            convo.ended_at = ended_at
+            await db.commit()
 
-                if message.get("bytes") is not None:
-                    await relay.on_audio_bytes(message["bytes"])
-                    continue
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                raise error
 
-        except WebSocketDisconnect:
-            ended_at = datetime.now(timezone.utc)
-            convo = await db.get(Conversation, conversation_uuid)
-            if convo is not None:
-                convo.ended_at = ended_at
-                await db.commit()
+
+async def _read_loop(relay: Relay, inbox: SessionInbox) -> None:
+    # Never awaits event handling: frames are routed to their lane and the
+    # next receive() is issued immediately.
+    while True:
+        message = await relay.websocket.receive()
+        if message["type"] == "websocket.disconnect":
             return
 
+        if message.get("bytes") is not None:
+            inbox.audio.offer(message["bytes"])
+            continue
+
+        if message.get("text") is None:
+            continue
+
+        payload = await _parse_text_message(relay, message["text"])
+        if payload is None:
+            continue
+
+        if payload["event"] == "ping":
+            await relay.send_event({"event": "pong"})
+            continue
+
+        for dropped in inbox.control.offer(payload):
+            if dropped is not None:
+                await relay.send_event(
+                    {
+                        "event": "error",
+                        "message": "Too many pending events",
+                        "dropped_event": dropped["event"],
+                    }
+                )
+
 
-async def _handle_text_message(relay: Relay, db: AsyncSession, text: str) -> None:
+async def _audio_worker(relay: Relay, inbox: SessionInbox) -> None:
+    while True:
+        chunk = await inbox.audio.get()
+        stats.audio_bytes += len(chunk)
+        await relay.on_audio_bytes(chunk)
+
+
+async def _control_worker(relay: Relay, db: AsyncSession, inbox: SessionInbox) -> None:
+    while True:
+        payload = await inbox.control.get()
+        if payload is None:
+            return
+        await _handle_control_event(relay, db, payload)
+
+
+async def _parse_text_message(relay: Relay, text: str) -> dict[str, Any] | None:
     try:
         payload: Any = json.loads(text)
     except json.JSONDecodeError:
         await relay.send_event({"event": "error", "message": "Invalid JSON"})
-        return
+        return None
 
     if not isinstance(payload, dict) or "event" not in payload:
         await relay.send_event({"event": "error", "message": "Missing event field"})
-        return
+        return None
 
-    event_name = payload.get("event")
+    return payload
 
-    if event_name == "ping":
-        await relay.send_event({"event": "pong"})
-        return
+
+async def _handle_control_event(relay: Relay, db: AsyncSession, payload: dict[str, Any]) -> None:
+    event_name = payload.get("event")
 
     if event_name == "client.started":
         audio_enabled = bool(payload.get("audio_enabled", True))
@@ -100,14 +199,9 @@ async def _handle_text_message(relay: Relay, db: AsyncSession, text: str) -> Non
 
     if event_name == "client.custom.message":
         text_value = payload.get("text")
-        print(
-            f"client.custom.message conversation_id={relay.conversation_id} text={text_value!r}",
-            flush=True,
-        )
         logger.info(
-            "client.custom.message conversation_id=%s text=%r",
-            relay.conversation_id,
-            text_value,
+            "client.custom.message",
+            extra=relay.log_fields("client.custom.message", text=text_value),
         )
         await relay.send_event({"event": "server.custom.message", "text": text_value})
         return
@@ -124,12 +218,22 @@ async def _handle_text_message(relay: Relay, db: AsyncSession, text: str) -> Non
             relay.history.clear()
             await relay.send_event({"event": "conversation.reset"})
             return
+
+        if drain.draining:
+            await relay.send_event(
+                {"event": "error", "message": "Server is draining; reconnect to continue"}
+            )
+            return
+
         logger.info(
-            "client.text.message conversation_id=%s text=%r",
-            relay.conversation_id,
-            text_value,
+            "client.text.message",
+            extra=relay.log_fields("client.text.message", text_len=len(text_value)),
         )
 
+        # Barge-in: if an assistant response is currently streaming, cancel it
+        # before the DB round-trip so the client sees it immediately.
+        await relay.cancel_assistant_stream(reason="new_user_message")
+
         if relay.db_conversation_id is not None:
             db.add(
                 Message(
@@ -143,9 +247,6 @@ async def _handle_text_message(relay: Relay, db: AsyncSession, text: str) -> Non
 
         relay.add_user_text(text_value)
 
-        # Barge-in: if an assistant response is currently streaming, cancel it.
-        await relay.cancel_assistant_stream(reason="new_user_message")
-
         global llm
         if llm is None:
             try:
@@ -191,16 +292,20 @@ async def _handle_text_message(relay: Relay, db: AsyncSession, text: str) -> Non
             answer = "".join(full_text_parts)
             relay.add_assistant_text(answer)
             if relay.db_conversation_id is not None:
-                db.add(
-                    Message(
-                        conversation_id=relay.db_conversation_id,
-                        role="assistant",
-                        content=answer,
-                        created_at=datetime.now(timezone.utc),
+                # Own session: this task runs concurrently with the control
+                # worker, and an AsyncSession must not be used from both.
+                async with AsyncSessionMaker() as stream_db:
+                    stream_db.add(
+                        Message(
+                            conversation_id=relay.db_conversation_id,
+                            role="assistant",
+                            content=answer,
+                            created_at=datetime.now(timezone.utc),
+                        )
                     )
-                )
-                await db.commit()
+                    await stream_db.commit()
 
+            stats.answers_completed += 1
             await relay.send_event(
                 {
                     "event": "assistant.message.completed",
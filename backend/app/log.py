@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from app.config import settings
+
+# color_message is uvicorn's ANSI-colored duplicate of msg.
+_RESERVED = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message",
+    "asctime",
+    "color_message",
+}
+
+_UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+_listener: _Listener | None = None
+_handler: DroppingQueueHandler | None = None
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        out: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker_id": settings.worker_id,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                out[key] = value
+        if record.exc_info:
+            out["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            out["exc"] = record.exc_text
+        return json.dumps(out, default=str)
+
+
+class EventSampler(logging.Filter):
+    """Per-event sampling and token-bucket rate limiting.
+
+    Only records logged with `extra={"event": ...}` are considered. How many
+    records were suppressed since the last one that got through is attached to
+    that record as `suppressed`.
+    """
+
+    def __init__(self, sample_rates: dict[str, float], rate_limits: dict[str, float]) -> None:
+        super().__init__()
+        self._sample_rates = sample_rates
+        self._rate_limits = rate_limits
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._suppressed: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        event = getattr(record, "event", None)
+        if event is None or record.levelno >= logging.WARNING:
+            return True
+
+        with self._lock:
+            if self._allow(event):
+                suppressed = self._suppressed.pop(event, 0)
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            self._suppressed[event] = self._suppressed.get(event, 0) + 1
+            return False
+
+    def _allow(self, event: str) -> bool:
+        rate = self._sample_rates.get(event)
+        if rate is not None and random.random() >= rate:
+            return False
+
+        limit = self._rate_limits.get(event)
+        if limit is None:
+            return True
+        now = time.monotonic()
+        tokens, last = self._buckets.get(event, (limit, now))
+        tokens = min(limit, tokens + (now - last) * limit)
+        if tokens < 1:
+            self._buckets[event] = (tokens, now)
+            return False
+        self._buckets[event] = (tokens - 1, now)
+        return True
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Never blocks the caller: when the writer falls behind, records are dropped."""
+
+    def __init__(self, q: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve args and tracebacks on the caller's side (they may not outlive
+        # the call) but leave the JSON formatting to the writer thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The handler's queue may be full at shutdown; wait for the writer
+        # to make room rather than losing the stop signal.
+        self.queue.put(self._sentinel)
+
+
+def configure_logging() -> None:
+    """Route the root logger through a bounded queue to a background writer thread."""
+    global _listener, _handler
+    root = logging.getLogger()
+    root.setLevel(settings.log_level)
+    if root.handlers:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    if settings.log_format == "json":
+        stream.setFormatter(JSONFormatter())
+    else:
+        stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    records: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=settings.log_queue_size)
+    handler = DroppingQueueHandler(records)
+    handler.addFilter(EventSampler(settings.log_sample_rates, settings.log_rate_limits))
+    root.addHandler(handler)
+    _handler = handler
+
+    # Uvicorn gives its loggers their own synchronous stdout handlers and
+    # turns propagation off; send them through the queue like everything else.
+    for name in _UVICORN_LOGGERS:
+        uv_logger = logging.getLogger(name)
+        uv_logger.handlers.clear()
+        uv_logger.propagate = True
+
+    _listener = _Listener(records, stream, respect_handler_level=True)
+    _listener.start()
+
+
+def dropped_records() -> int:
+    """Records discarded because the writer thread fell behind."""
+    return _handler.dropped if _handler is not None else 0
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and switch the root logger back to direct writes.
+
+    Records logged after this (uvicorn's final lines, a worker's exit path)
+    would otherwise sit in a queue nobody reads.
+    """
+    global _listener
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    root.removeHandler(_handler)
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener.stop()
+    _listener = None
@@ -1,26 +1,32 @@
+import asyncio
 import logging
-import sys
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
+from app.api.admin import router as admin_router
 from app.api.health import router as health_router
+from app.api.metrics import router as metrics_router
+from app.api.search import router as search_router
 from app.api.websocket import router as websocket_router
-from app.database import engine
+from app.database import column_exists, engine
+from app.log import configure_logging, shutdown_logging
 from app.models import Base
+from app.services.drain import drain
+from app.services.llm import close_http_client
+from app.services.metrics import publish_forever
+
+logger = logging.getLogger(__name__)
+
+_MIGRATED_COLUMNS = (
+    ("messages", "search_vector", "add_message_search"),
+    ("conversations", "recording_path", "add_recording_path"),
+)
 
 
 def create_app() -> FastAPI:
-    root = logging.getLogger()
-    root.setLevel(logging.INFO)
-    if not root.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(logging.INFO)
-        formatter = logging.Formatter(
-            "%(asctime)s %(levelname)s %(name)s: %(message)s"
-        )
-        handler.setFormatter(formatter)
-        root.addHandler(handler)
+    configure_logging()
 
     app = FastAPI(title="Conversation Relay (Local)")
 
@@ -32,13 +38,46 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.include_router(admin_router)
     app.include_router(health_router)
+    app.include_router(metrics_router)
+    app.include_router(search_router)
     app.include_router(websocket_router)
 
+    background: list[asyncio.Task[None]] = []
+
     @app.on_event("startup")
     async def _startup() -> None:
         async with engine.begin() as conn:
+            # Serialize schema setup when several workers start at once.
+            await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('cr_schema'))"))
             await conn.run_sync(Base.metadata.create_all)
+            # Columns added after release are left to the one-off migrations:
+            # ALTER TABLE on every worker start would lock hot tables.
+            for table, column, migration in _MIGRATED_COLUMNS:
+                if not await column_exists(conn, table, column):
+                    logger.warning(
+                        "%s.%s is missing; run `python -m migrations.%s`", table, column, migration
+                    )
+        drain.install_signal_handlers()
+        background.append(asyncio.create_task(publish_forever()))
+
+    @app.on_event("shutdown")
+    async def _shutdown() -> None:
+        # Uvicorn has already closed every connection by now (e.g. after Ctrl+C),
+        # so there is nothing left to wait for: finish any drain started via
+        # /admin/drain without its grace period and finalize leftover rows.
+        drain.skip_grace()
+        try:
+            await drain.drain()
+        except Exception:
+            # E.g. the DB is unreachable mid-deploy; still release everything below.
+            logger.exception("drain failed during shutdown")
+        for task in background:
+            task.cancel()
+        await close_http_client()
+        await engine.dispose()
+        shutdown_logging()
 
     return app
 
@@ -3,15 +3,29 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, Text, event
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
 
+SEARCH_CONFIG = "english"
+
+# A trigger rather than a GENERATED column: a trigger-maintained column can be
+# added to an existing table without a rewrite (see migrations/add_message_search.py).
+SEARCH_TRIGGER_DDL = (
+    "CREATE TRIGGER messages_search_vector_update "
+    "BEFORE INSERT OR UPDATE OF content ON messages "
+    "FOR EACH ROW EXECUTE FUNCTION "
+    f"tsvector_update_trigger(search_vector, 'pg_catalog.{SEARCH_CONFIG}', content)"
+)
+
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     conversation_id: Mapped[UUID] = mapped_column(
@@ -20,3 +34,8 @@ class Message(Base):
     role: Mapped[str] = mapped_column(Text, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Maintained by Postgres on every insert/update, so the write path never touches it.
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+
+
+event.listen(Message.__table__, "after_create", DDL(SEARCH_TRIGGER_DDL))
@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchHitOut(BaseModel):
+    conversation_id: UUID
+    message_id: UUID
+    role: str
+    rank: float
+    snippet: str
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: list[SearchHitOut]
+    next_cursor: str | None = None
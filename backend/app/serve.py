@@ -0,0 +1,249 @@
+"""Multi-worker launcher: N forked uvicorn workers sharing one listening socket.
+
+    python -m app.serve --workers 8 --db-budget 80 --uvloop --pin-cpus
+
+The parent binds the socket and forks before importing the app, so every
+worker builds its own event loop, DB engine, LLM HTTP pool and settings.
+SIGTERM/SIGINT are forwarded to the workers as SIGTERM, so they drain before
+exiting; a second signal skips the drain grace period.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import importlib.util
+import logging
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger("app.serve")
+
+_SIGNALS = {signal.SIGTERM, signal.SIGINT}
+# Exit code for a worker whose app never finished startup (matches uvicorn's CLI).
+STARTUP_FAILURE = 3
+# A worker that dies sooner than this after starting counts as a crash loop.
+_MIN_HEALTHY_UPTIME_S = 10.0
+_MAX_RESTART_DELAY_S = 30.0
+_PR_SET_PDEATHSIG = 1
+
+
+def _watch_parent(parent_pid: int) -> None:
+    while os.getppid() == parent_pid:
+        time.sleep(1.0)
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _exit_with_parent(parent_pid: int) -> None:
+    # If the launcher is SIGKILLed/OOM-killed, workers would keep serving the
+    # inherited socket as orphans that no signal to the launcher can reach.
+    # SIGTERM them instead, which runs the normal drain.
+    if sys.platform.startswith("linux"):
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.prctl(_PR_SET_PDEATHSIG, signal.SIGTERM)
+    else:
+        threading.Thread(target=_watch_parent, args=(parent_pid,), daemon=True).start()
+    if os.getppid() != parent_pid:
+        # The launcher died before the hook was in place.
+        os._exit(0)
+
+
+def _bind(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(worker_id: int, sock: socket.socket, args: argparse.Namespace, env: dict[str, str]) -> int:
+    # The parent's forwarding handlers must not survive the fork: uvicorn
+    # restores whatever it found on shutdown, which would signal the siblings.
+    for signum in _SIGNALS:
+        signal.signal(signum, signal.SIG_DFL)
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, _SIGNALS)
+    _exit_with_parent(int(env["CR_LAUNCHER_PID"]))
+
+    # Own process group: a terminal Ctrl+C reaches only the parent, which
+    # forwards a single SIGTERM so workers drain instead of force-exiting.
+    os.setpgid(0, 0)
+    os.environ.update(env)
+    os.environ["CR_WORKER_ID"] = str(worker_id)
+    # Drop the launcher's synchronous handler; the app installs its queued one.
+    logging.getLogger().handlers.clear()
+
+    if args.pin_cpus:
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[worker_id % len(cpus)]})
+
+    # Imported only after fork so no engine, pool or event loop is shared.
+    import uvicorn
+
+    config = uvicorn.Config(
+        "app.main:app",
+        loop="uvloop" if args.uvloop else "asyncio",
+        log_level=args.log_level,
+        # Skip uvicorn's own synchronous handlers; app.log routes its loggers
+        # through the root queue handler.
+        log_config=None,
+        timeout_graceful_shutdown=args.graceful_timeout,
+    )
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+    return 0 if server.started else STARTUP_FAILURE
+
+
+def _spawn(worker_id: int, sock: socket.socket, args: argparse.Namespace, env: dict[str, str]) -> int:
+    # Keep signals blocked across fork so none lands in the child before it
+    # has reset the parent's handlers.
+    signal.pthread_sigmask(signal.SIG_BLOCK, _SIGNALS)
+    try:
+        pid = os.fork()
+    except OSError:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, _SIGNALS)
+        raise
+    if pid == 0:
+        code = 1
+        try:
+            code = _run_worker(worker_id, sock, args, env)
+        except BaseException:
+            logger.exception("worker %d crashed", worker_id)
+        finally:
+            # os._exit skips atexit, so flush the app's log queue first (it may
+            # still hold e.g. uvicorn's "Application startup failed" traceback).
+            try:
+                if "app.log" in sys.modules:
+                    sys.modules["app.log"].shutdown_logging()
+            finally:
+                os._exit(code)
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, _SIGNALS)
+    logger.info("started worker %d pid=%d", worker_id, pid)
+    return pid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--db-budget",
+        type=int,
+        default=None,
+        help="total DB connections across all workers (split evenly, no overflow)",
+    )
+    parser.add_argument("--uvloop", action="store_true", help="run each worker on uvloop")
+    parser.add_argument("--pin-cpus", action="store_true", help="pin worker i to CPU i")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--graceful-timeout", type=int, default=None)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.uvloop and importlib.util.find_spec("uvloop") is None:
+        logger.warning("uvloop is not installed; falling back to asyncio")
+        args.uvloop = False
+    if args.pin_cpus and not hasattr(os, "sched_setaffinity"):
+        logger.warning("CPU pinning is not supported on this platform")
+        args.pin_cpus = False
+
+    env: dict[str, str] = {}
+    if args.db_budget is not None:
+        per_worker = args.db_budget // args.workers
+        if per_worker < 1:
+            parser.error("--db-budget must allow at least one connection per worker")
+        env["CR_DB_POOL_SIZE"] = str(per_worker)
+        env["CR_DB_MAX_OVERFLOW"] = "0"
+    own_metrics_dir = not os.environ.get("CR_METRICS_DIR")
+    metrics_dir = os.environ.get("CR_METRICS_DIR") or tempfile.mkdtemp(prefix="cr-metrics-")
+    env["CR_METRICS_DIR"] = metrics_dir
+    env["CR_LAUNCHER_PID"] = str(os.getpid())
+
+    sock = _bind(args.host, args.port, args.backlog)
+    logger.info(
+        "listening on %s:%d workers=%d db_pool=%s uvloop=%s pin_cpus=%s",
+        args.host,
+        args.port,
+        args.workers,
+        env.get("CR_DB_POOL_SIZE", "default"),
+        args.uvloop,
+        args.pin_cpus,
+    )
+
+    workers: dict[int, int] = {}
+    started_at: dict[int, float] = {}
+    crash_streak: dict[int, int] = {}
+    stopping = False
+
+    def _forward(_signum: int, _frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    # Installed before the first fork so there is no window in which a
+    # signal kills the parent and orphans workers.
+    for signum in _SIGNALS:
+        signal.signal(signum, _forward)
+
+    def _start(worker_id: int) -> None:
+        workers[_spawn(worker_id, sock, args, env)] = worker_id
+        started_at[worker_id] = time.monotonic()
+
+    for worker_id in range(args.workers):
+        _start(worker_id)
+
+    try:
+        while workers:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            worker_id = workers.pop(pid, None)
+            if worker_id is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if stopping:
+                logger.info("worker %d pid=%d exited code=%d", worker_id, pid, code)
+                continue
+
+            if time.monotonic() - started_at[worker_id] < _MIN_HEALTHY_UPTIME_S:
+                crash_streak[worker_id] = crash_streak.get(worker_id, 0) + 1
+            else:
+                crash_streak[worker_id] = 0
+            delay = min(_MAX_RESTART_DELAY_S, 2.0 ** crash_streak[worker_id])
+            logger.warning(
+                "worker %d pid=%d died code=%d; restarting in %.0fs",
+                worker_id,
+                pid,
+                code,
+                delay,
+            )
+            deadline = time.monotonic() + delay
+            while not stopping and time.monotonic() < deadline:
+                time.sleep(0.2)
+            if not stopping:
+                _start(worker_id)
+    finally:
+        sock.close()
+        if own_metrics_dir:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
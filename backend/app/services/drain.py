@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import update
+
+from app.config import settings
+from app.database import AsyncSessionMaker
+from app.models.conversation import Conversation
+from app.services.relay import Relay
+
+logger = logging.getLogger(__name__)
+
+# 1012 "Service Restart": clients should reconnect, ideally to another instance.
+DRAIN_CLOSE_CODE = 1012
+
+
+def draining_event() -> dict[str, Any]:
+    return {"event": "session.draining", "reason": "server_shutdown", "reconnect": True}
+
+
+@dataclass(slots=True)
+class DrainController:
+    grace_period_s: float
+    draining: bool = False
+    _sessions: dict[str, Relay] = field(default_factory=dict, init=False, repr=False)
+    _drain_task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+    _skip_grace: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+
+    def register(self, relay: Relay) -> None:
+        self._sessions[relay.conversation_id] = relay
+
+    def unregister(self, relay: Relay) -> None:
+        self._sessions.pop(relay.conversation_id, None)
+
+    @property
+    def active_sessions(self) -> int:
+        return len(self._sessions)
+
+    def start(self) -> asyncio.Task[None]:
+        if self._drain_task is None:
+            self.draining = True
+            logger.info("drain started active_sessions=%d", self.active_sessions)
+            self._drain_task = asyncio.create_task(self._drain())
+        return self._drain_task
+
+    async def drain(self) -> None:
+        await asyncio.shield(self.start())
+
+    def skip_grace(self) -> None:
+        """Stop waiting for in-flight answers; they are cancelled right away."""
+        self._skip_grace.set()
+
+    async def _drain(self) -> None:
+        # Snapshot up front: sessions unregister as their sockets close, but
+        # their answers still need cancelling and their rows finalizing.
+        relays = list(self._sessions.values())
+        pending = [
+            task
+            for relay in relays
+            if (task := relay.get_assistant_task()) is not None and not task.done()
+        ]
+        if pending:
+            finished = asyncio.create_task(asyncio.wait(pending))
+            skipped = asyncio.create_task(self._skip_grace.wait())
+            await asyncio.wait(
+                {finished, skipped},
+                timeout=self.grace_period_s,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            finished.cancel()
+            skipped.cancel()
+            still_running = sum(not task.done() for task in pending)
+            if still_running:
+                logger.info("drain grace period over, cancelling %d answers", still_running)
+
+        await asyncio.gather(*(self._close(relay) for relay in relays), return_exceptions=True)
+        await self._finalize(relays)
+        logger.info("drain completed sessions=%d", len(relays))
+
+    async def _close(self, relay: Relay) -> None:
+        await relay.cancel_assistant_stream(reason="draining")
+        await relay.send_event(draining_event())
+        await relay.websocket.close(code=DRAIN_CLOSE_CODE)
+
+    async def _finalize(self, relays: list[Relay]) -> None:
+        ids = [r.db_conversation_id for r in relays if r.db_conversation_id is not None]
+        if not ids:
+            return
+        async with AsyncSessionMaker() as db:
+            await db.execute(
+                update(Conversation)
+                .where(Conversation.id.in_(ids), Conversation.ended_at.is_(None))
+                .values(ended_at=datetime.now(timezone.utc))
+            )
+            await db.commit()
+
+    def install_signal_handlers(self) -> None:
+        # Uvicorn exits as soon as it sees SIGTERM, closing every socket. Run the
+        # drain first and only then hand the signal back to the previous handler.
+        previous = signal.getsignal(signal.SIGTERM)
+        loop = asyncio.get_running_loop()
+
+        def _exit(_: object = None) -> None:
+            if callable(previous):
+                previous(signal.SIGTERM, None)
+            else:
+                loop.remove_signal_handler(signal.SIGTERM)
+                signal.raise_signal(signal.SIGTERM)
+
+        def _force_exit() -> None:
+            if callable(previous):
+                # Uvicorn only escalates to a forced exit on a repeated SIGINT,
+                # so hand it an exit request followed by one.
+                previous(signal.SIGTERM, None)
+                previous(signal.SIGINT, None)
+            else:
+                _exit()
+
+        def _on_sigterm() -> None:
+            if self._drain_task is None:
+                self.start().add_done_callback(_exit)
+            elif not self._skip_grace.is_set():
+                # A second SIGTERM skips the remaining grace period; sessions
+                # still get session.draining before uvicorn is told to exit.
+                self.skip_grace()
+            else:
+                # A third SIGTERM stops waiting for anything, including the drain.
+                _force_exit()
+
+        try:
+            loop.add_signal_handler(signal.SIGTERM, _on_sigterm)
+        except (NotImplementedError, RuntimeError):
+            logger.warning("SIGTERM drain handler unavailable on this platform")
+
+
+drain = DrainController(grace_period_s=settings.drain_grace_period_s)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Generic, Literal, TypeVar
+
+from app.config import settings
+
+T = TypeVar("T")
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest"]
+
+
+class BoundedQueue(Generic[T]):
+    """asyncio.Queue whose producer never waits: overflow drops items instead.
+
+    Bounded by item count and, when `max_bytes` is set, by the total len() of
+    queued items, since a single client frame can be megabytes.
+    """
+
+    def __init__(self, maxsize: int, overflow: OverflowPolicy, max_bytes: int | None = None) -> None:
+        self._queue: asyncio.Queue[T] = asyncio.Queue()
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.overflow = overflow
+        self.queued_bytes = 0
+        self.dropped = 0
+
+    def _size(self, item: T) -> int:
+        if self.max_bytes is None:
+            return 0
+        return len(item)  # type: ignore[arg-type]
+
+    def _fits(self, size: int) -> bool:
+        if self._queue.qsize() >= self.maxsize:
+            return False
+        return self.max_bytes is None or self.queued_bytes + size <= self.max_bytes
+
+    def offer(self, item: T) -> list[T]:
+        """Enqueue without blocking. Returns the items dropped to make room (or `item`)."""
+        size = self._size(item)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.dropped += 1
+            return [item]
+
+        evicted: list[T] = []
+        while not self._fits(size):
+            self.dropped += 1
+            if self.overflow == "drop_newest" or self._queue.empty():
+                return evicted + [item]
+            oldest = self._queue.get_nowait()
+            self.queued_bytes -= self._size(oldest)
+            evicted.append(oldest)
+
+        self._queue.put_nowait(item)
+        self.queued_bytes += size
+        return evicted
+
+    async def get(self) -> T:
+        item = await self._queue.get()
+        self.queued_bytes -= self._size(item)
+        return item
+
+    def clear(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.queued_bytes = 0
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+
+@dataclass(slots=True)
+class SessionInbox:
+    # Audio and control events travel in separate lanes so a slow control
+    # handler (DB commits, LLM setup) never holds up audio ingest.
+    audio: BoundedQueue[bytes]
+    control: BoundedQueue[dict[str, Any] | None]
+
+    @classmethod
+    def from_settings(cls) -> SessionInbox:
+        return cls(
+            audio=BoundedQueue(
+                settings.inbound_audio_queue,
+                settings.inbound_audio_overflow,
+                max_bytes=settings.inbound_audio_queue_bytes,
+            ),
+            control=BoundedQueue(
+                settings.inbound_control_queue, settings.inbound_control_overflow
+            ),
+        )
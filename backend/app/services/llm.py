@@ -14,6 +14,30 @@ class LLMError(RuntimeError):
     pass
 
 
+_http: httpx.AsyncClient | None = None
+
+
+def _http_client() -> httpx.AsyncClient:
+    # One keep-alive pool per process, shared by all providers; created lazily
+    # so it binds to the worker's own event loop.
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_connections,
+            )
+        )
+    return _http
+
+
+async def close_http_client() -> None:
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
+
 class LLM(Protocol):
     async def chat(self, messages: list[dict[str, str]]) -> str: ...
     async def stream(self, messages: list[dict[str, str]]) -> AsyncIterator[str]: ...
@@ -129,8 +153,9 @@ class OllamaLLM:
             "stream": False,
         }
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.post(f"{self._base_url}/api/chat", json=payload)
+        resp = await _http_client().post(
+            f"{self._base_url}/api/chat", json=payload, timeout=self._timeout
+        )
 
         if resp.status_code >= 400:
             raise LLMError(f"Ollama error {resp.status_code}: {resp.text}")
@@ -169,12 +194,12 @@ class OpenAILLM:
         }
 
         headers = {"Authorization": f"Bearer {self._api_key}"}
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.post(
-                f"{self._base_url}/chat/completions",
-                json=payload,
-                headers=headers,
-            )
+        resp = await _http_client().post(
+            f"{self._base_url}/chat/completions",
+            json=payload,
+            headers=headers,
+            timeout=self._timeout,
+        )
 
         if resp.status_code >= 400:
             raise LLMError(f"OpenAI error {resp.status_code}: {resp.text}")
@@ -198,38 +223,38 @@ class OpenAILLM:
 
         headers = {"Authorization": f"Bearer {self._api_key}"}
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{self._base_url}/chat/completions",
-                json=payload,
-                headers=headers,
-            ) as resp:
-                if resp.status_code >= 400:
-                    body = (await resp.aread()).decode("utf-8", errors="replace")
-                    raise LLMError(f"OpenAI error {resp.status_code}: {body}")
-
-                async for line in resp.aiter_lines():
-                    if not line or not line.startswith("data:"):
-                        continue
-
-                    data = line.removeprefix("data:").strip()
-                    if data == "[DONE]":
-                        break
+        async with _http_client().stream(
+            "POST",
+            f"{self._base_url}/chat/completions",
+            json=payload,
+            headers=headers,
+            timeout=self._timeout,
+        ) as resp:
+            if resp.status_code >= 400:
+                body = (await resp.aread()).decode("utf-8", errors="replace")
+                raise LLMError(f"OpenAI error {resp.status_code}: {body}")
+
+            async for line in resp.aiter_lines():
+                if not line or not line.startswith("data:"):
+                    continue
+
+                data = line.removeprefix("data:").strip()
+                if data == "[DONE]":
+                    break
 
-                    try:
-                        evt = json.loads(data)
-                    except Exception:
-                        continue
+                try:
+                    evt = json.loads(data)
+                except Exception:
+                    continue
 
-                    choices = evt.get("choices")
-                    if not isinstance(choices, list) or not choices:
-                        continue
+                choices = evt.get("choices")
+                if not isinstance(choices, list) or not choices:
+                    continue
 
-                    delta = (choices[0] or {}).get("delta") or {}
-                    chunk = delta.get("content")
-                    if isinstance(chunk, str) and chunk:
-                        yield chunk
+                delta = (choices[0] or {}).get("delta") or {}
+                chunk = delta.get("content")
+                if isinstance(chunk, str) and chunk:
+                    yield chunk
 
 
 class GeminiLLM:
@@ -262,8 +287,7 @@ class GeminiLLM:
         )
         payload: dict[str, Any] = {"contents": contents}
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.post(url, json=payload)
+        resp = await _http_client().post(url, json=payload, timeout=self._timeout)
 
         if resp.status_code >= 400:
             raise LLMError(f"Gemini error {resp.status_code}: {resp.text}")
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+from app.database import engine
+from app.log import dropped_records
+from app.services.drain import drain
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_INTERVAL_S = 1.0
+STALE_AFTER_S = 5 * PUBLISH_INTERVAL_S
+
+
+@dataclass(slots=True)
+class WorkerStats:
+    sessions_started: int = 0
+    answers_completed: int = 0
+    audio_bytes: int = 0
+
+
+stats = WorkerStats()
+
+
+def snapshot() -> dict[str, Any]:
+    pool = engine.sync_engine.pool
+    return {
+        "worker_id": settings.worker_id,
+        "pid": os.getpid(),
+        "updated_at": time.time(),
+        "active_sessions": drain.active_sessions,
+        "draining": drain.draining,
+        "db_pool_size": pool.size(),
+        "db_checked_out": pool.checkedout(),
+        "log_records_dropped": dropped_records(),
+        **asdict(stats),
+    }
+
+
+def _stats_path(metrics_dir: str, worker_id: int) -> Path:
+    return Path(metrics_dir) / f"worker-{worker_id}.json"
+
+
+def _write_snapshot(path: Path, data: dict[str, Any]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+async def publish_forever() -> None:
+    # Workers share nothing in memory, so each one drops its snapshot into a
+    # common directory and any worker can serve the aggregate.
+    if not settings.metrics_dir:
+        return
+    path = _stats_path(settings.metrics_dir, settings.worker_id)
+    while True:
+        try:
+            await asyncio.to_thread(_write_snapshot, path, snapshot())
+        except OSError:
+            logger.exception("failed to publish worker stats to %s", path)
+        await asyncio.sleep(PUBLISH_INTERVAL_S)
+
+
+def _read_snapshots(metrics_dir: str) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for path in sorted(Path(metrics_dir).glob("worker-*.json")):
+        try:
+            out.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            continue
+    return out
+
+
+async def collect() -> dict[str, Any]:
+    own = snapshot()
+    workers = [own]
+    if settings.metrics_dir:
+        others = await asyncio.to_thread(_read_snapshots, settings.metrics_dir)
+        workers += [w for w in others if w.get("worker_id") != own["worker_id"]]
+        workers.sort(key=lambda w: w.get("worker_id", 0))
+
+    now = time.time()
+    for w in workers:
+        w["stale"] = now - float(w.get("updated_at", 0)) > STALE_AFTER_S
+
+    live = [w for w in workers if not w["stale"]]
+    totals = {
+        key: sum(int(w.get(key, 0)) for w in live)
+        for key in (
+            "active_sessions",
+            "sessions_started",
+            "answers_completed",
+            "audio_bytes",
+            "db_pool_size",
+            "db_checked_out",
+            "log_records_dropped",
+        )
+    }
+    totals["workers"] = len(live)
+    return {"totals": totals, "workers": workers}
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+from pathlib import Path
+from typing import BinaryIO
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Inbound audio is f32le mono @ 16 kHz (see the session.started event).
+SAMPLE_RATE = 16000
+CHANNELS = 1
+BYTES_PER_SAMPLE = 4
+
+_WAVE_FORMAT_IEEE_FLOAT = 3
+_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_MAX_DATA_BYTES = 0xFFFFFFFF - (_HEADER.size - 8)
+
+
+def _wav_header(data_bytes: int) -> bytes:
+    data_bytes = min(data_bytes, _MAX_DATA_BYTES)
+    return _HEADER.pack(
+        b"RIFF",
+        _HEADER.size - 8 + data_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        _WAVE_FORMAT_IEEE_FLOAT,
+        CHANNELS,
+        SAMPLE_RATE,
+        SAMPLE_RATE * CHANNELS * BYTES_PER_SAMPLE,
+        CHANNELS * BYTES_PER_SAMPLE,
+        BYTES_PER_SAMPLE * 8,
+        b"data",
+        data_bytes,
+    )
+
+
+class Recording:
+    """Spools one session's inbound audio to a WAV file without blocking the relay.
+
+    write() only enqueues; a per-session writer task batches chunks into large
+    appends that run in a worker thread. Once `max_bytes` of audio is waiting
+    for the writer, further chunks are dropped rather than making the caller wait.
+    """
+
+    def __init__(self, path: Path, f: BinaryIO, max_bytes: int, write_bytes: int) -> None:
+        self.path = path
+        self.bytes_written = 0
+        self.dropped_bytes = 0
+        self._max_bytes = max_bytes
+        self._write_bytes = write_bytes
+        # Bounded by _queued_bytes, not item count: chunk sizes are client-chosen.
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._queued_bytes = 0
+        self._closed = False
+        self._task = asyncio.create_task(self._run(f))
+
+    @classmethod
+    async def open(cls, path: Path, max_bytes: int, write_bytes: int) -> Recording:
+        f = await asyncio.to_thread(cls._open, path)
+        return cls(path, f, max_bytes=max_bytes, write_bytes=write_bytes)
+
+    def write(self, chunk: bytes) -> None:
+        if (
+            self._closed
+            or self._task.done()
+            or self._queued_bytes + len(chunk) > self._max_bytes
+        ):
+            self.dropped_bytes += len(chunk)
+            return
+        self._queued_bytes += len(chunk)
+        self._queue.put_nowait(chunk)
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put_nowait(None)
+        await asyncio.gather(self._task, return_exceptions=True)
+        if self.dropped_bytes:
+            logger.warning(
+                "recording %s dropped %d bytes under backpressure", self.path, self.dropped_bytes
+            )
+
+    async def _run(self, f: BinaryIO) -> None:
+        buf = bytearray()
+        try:
+            while True:
+                chunk = await self._queue.get()
+                if chunk is None:
+                    break
+                self._queued_bytes -= len(chunk)
+                buf += chunk
+                if len(buf) >= self._write_bytes:
+                    await asyncio.to_thread(f.write, buf)
+                    self.bytes_written += len(buf)
+                    buf = bytearray()
+            if buf:
+                await asyncio.to_thread(f.write, buf)
+                self.bytes_written += len(buf)
+        except OSError:
+            logger.exception("recording %s write failed", self.path)
+        finally:
+            await asyncio.to_thread(self._finish, f, self.bytes_written)
+
+    @staticmethod
+    def _open(path: Path) -> BinaryIO:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = path.open("wb")
+        f.write(_wav_header(0))
+        return f
+
+    @staticmethod
+    def _finish(f: BinaryIO, data_bytes: int) -> None:
+        try:
+            f.seek(0)
+            f.write(_wav_header(data_bytes))
+        finally:
+            f.close()
+
+
+async def start_recording(conversation_id: str) -> Recording | None:
+    """Open the session's WAV file; None if recording is off or the file can't be created."""
+    if not settings.recording_enabled:
+        return None
+    path = Path(settings.recording_dir) / f"{conversation_id}.wav"
+    try:
+        return await Recording.open(
+            path,
+            max_bytes=settings.recording_queue_bytes,
+            write_bytes=settings.recording_write_bytes,
+        )
+    except OSError:
+        logger.exception("recording %s could not be opened", path)
+        return None
@@ -6,6 +6,8 @@ from uuid import UUID
 
 from fastapi import WebSocket
 
+from app.services.recorder import Recording
+
 
 @dataclass(slots=True)
 class Relay:
@@ -13,6 +15,7 @@ class Relay:
     conversation_id: str
     db_conversation_id: UUID | None = None
     audio_bytes_received: int = 0
+    recording: Recording | None = None
     history: list[dict[str, str]] = field(default_factory=list)
     _seq: int = field(default=0, init=False)
     _assistant_task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
@@ -34,6 +37,9 @@ class Relay:
     def get_assistant_message_id(self) -> str | None:
         return self._assistant_message_id
 
+    def log_fields(self, event: str, **fields: Any) -> dict[str, Any]:
+        return {"event": event, "conversation_id": self.conversation_id, "seq": self._seq, **fields}
+
     async def cancel_assistant_stream(self, reason: str = "barge_in") -> None:
         task = self._assistant_task
         message_id = self._assistant_message_id
@@ -56,6 +62,8 @@ class Relay:
 
     async def on_audio_bytes(self, chunk: bytes) -> None:
         self.audio_bytes_received += len(chunk)
+        if self.recording is not None:
+            self.recording.write(chunk)
         if self.audio_bytes_received % (16000 * 4) < len(chunk):
             await self.send_event(
                 {
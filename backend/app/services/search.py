@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import html
+import json
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.message import SEARCH_CONFIG, Message
+
+MAX_PAGE_SIZE = 100
+
+# ts_headline copies the document verbatim, so it highlights with private-use
+# sentinels; the snippet is HTML-escaped before they become <mark> tags.
+_START_SEL = "\ue000"
+_STOP_SEL = "\ue001"
+_HEADLINE_OPTIONS = (
+    f'StartSel="{_START_SEL}", StopSel="{_STOP_SEL}", MaxWords=24, MinWords=8, MaxFragments=2'
+)
+
+
+class SearchError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class SearchHit:
+    conversation_id: UUID
+    message_id: UUID
+    role: str
+    rank: float
+    snippet: str
+
+
+@dataclass(slots=True)
+class SearchPage:
+    hits: list[SearchHit]
+    next_cursor: str | None
+
+
+def encode_cursor(rank: float, conversation_id: UUID) -> str:
+    raw = json.dumps({"r": rank, "c": str(conversation_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return float(data["r"]), UUID(str(data["c"]))
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as e:
+        raise SearchError("Invalid cursor") from e
+
+
+def render_snippet(headline: str) -> str:
+    return html.escape(headline).replace(_START_SEL, "<mark>").replace(_STOP_SEL, "</mark>")
+
+
+async def search_conversations(
+    db: AsyncSession,
+    query: str,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> SearchPage:
+    query = query.strip()
+    if not query:
+        raise SearchError("q is required")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+    rank = func.ts_rank_cd(Message.search_vector, tsquery)
+
+    # Best-matching message per conversation; the GIN index serves the @@ filter.
+    best = (
+        select(
+            Message.conversation_id.label("conversation_id"),
+            Message.id.label("message_id"),
+            Message.role.label("role"),
+            Message.content.label("content"),
+            rank.label("rank"),
+        )
+        .where(Message.search_vector.op("@@")(tsquery))
+        .distinct(Message.conversation_id)
+        .order_by(Message.conversation_id, rank.desc(), Message.created_at.desc())
+        .subquery("best")
+    )
+
+    page = select(best)
+    if cursor is not None:
+        after_rank, after_id = decode_cursor(cursor)
+        page = page.where(
+            or_(
+                best.c.rank < after_rank,
+                and_(best.c.rank == after_rank, best.c.conversation_id > after_id),
+            )
+        )
+    page = (
+        page.order_by(best.c.rank.desc(), best.c.conversation_id)
+        .limit(limit + 1)
+        .subquery("page")
+    )
+
+    # ts_headline re-parses the document, so only run it on the rows being returned.
+    stmt = select(
+        page.c.conversation_id,
+        page.c.message_id,
+        page.c.role,
+        page.c.rank,
+        func.ts_headline(
+            SEARCH_CONFIG,
+            # Sentinels already in the text must not pass for highlight markers.
+            func.translate(page.c.content, _START_SEL + _STOP_SEL, ""),
+            tsquery,
+            _HEADLINE_OPTIONS,
+        ).label("snippet"),
+    ).order_by(page.c.rank.desc(), page.c.conversation_id)
+
+    rows = (await db.execute(stmt)).all()
+    hits = [
+        SearchHit(
+            conversation_id=row.conversation_id,
+            message_id=row.message_id,
+            role=row.role,
+            rank=float(row.rank),
+            snippet=render_snippet(row.snippet),
+        )
+        for row in rows[:limit]
+    ]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = hits[-1]
+        next_cursor = encode_cursor(last.rank, last.conversation_id)
+    return SearchPage(hits=hits, next_cursor=next_cursor)
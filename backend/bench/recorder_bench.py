@@ -0,0 +1,106 @@
+"""Measure recorder throughput and event-loop stall at high concurrent session counts.
+
+Each simulated session pushes 20 ms f32le frames into its own Recording while a
+ticker task measures how late the event loop wakes up. No DB or WebSocket needed:
+
+    python -m bench.recorder_bench --sessions 100 500 1000 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.recorder import BYTES_PER_SAMPLE, SAMPLE_RATE, Recording
+
+FRAME_MS = 20
+FRAME_BYTES = SAMPLE_RATE * FRAME_MS // 1000 * BYTES_PER_SAMPLE
+
+
+async def _session(rec: Recording, frames: int, realtime: bool) -> None:
+    frame = b"\x00" * FRAME_BYTES
+    interval = FRAME_MS / 1000
+    start = time.perf_counter()
+    for i in range(frames):
+        rec.write(frame)
+        if realtime:
+            delay = start + (i + 1) * interval - time.perf_counter()
+            await asyncio.sleep(max(0.0, delay))
+        elif i % 50 == 0:
+            await asyncio.sleep(0)
+
+
+async def _ticker(stop: asyncio.Event, lags: list[float]) -> None:
+    period = 0.005
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(period)
+        lags.append(time.perf_counter() - t0 - period)
+
+
+async def run(sessions: int, seconds: float, realtime: bool, out_dir: Path, args: argparse.Namespace) -> None:
+    frames = int(seconds * 1000 / FRAME_MS)
+    recs = [
+        await Recording.open(
+            out_dir / f"{sessions}-{i}.wav",
+            max_bytes=args.queue_bytes,
+            write_bytes=args.write_bytes,
+        )
+        for i in range(sessions)
+    ]
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(stop, lags))
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_session(r, frames, realtime) for r in recs))
+    ingest_s = time.perf_counter() - t0
+    await asyncio.gather(*(r.close() for r in recs))
+    total_s = time.perf_counter() - t0
+    stop.set()
+    await ticker
+
+    offered = sessions * frames * FRAME_BYTES
+    written = sum(r.bytes_written for r in recs)
+    dropped = sum(r.dropped_bytes for r in recs)
+    lags.sort()
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000 if lags else 0.0
+    worst = lags[-1] * 1000 if lags else 0.0
+    print(
+        f"{sessions:>6} {ingest_s:>9.2f} {total_s:>9.2f} "
+        f"{written / total_s / 1e6:>10.1f} {100 * dropped / offered:>7.2f} "
+        f"{p99:>9.2f} {worst:>9.2f}"
+    )
+
+    for r in recs:
+        r.path.unlink(missing_ok=True)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 100, 500, 1000])
+    parser.add_argument("--seconds", type=float, default=5.0, help="audio seconds per session")
+    parser.add_argument("--burst", action="store_true", help="send frames as fast as possible")
+    parser.add_argument("--queue-bytes", type=int, default=2 * 1024 * 1024)
+    parser.add_argument("--write-bytes", type=int, default=256 * 1024)
+    parser.add_argument("--dir", type=Path, default=None, help="target directory (default: tmp)")
+    args = parser.parse_args()
+
+    out_dir = args.dir or Path(tempfile.mkdtemp(prefix="cr-rec-bench-"))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    print(f"{'sess':>6} {'ingest s':>9} {'total s':>9} {'MB/s':>10} {'drop %':>7} {'lag p99':>9} {'lag max':>9}")
+    try:
+        for n in args.sessions:
+            await run(n, args.seconds, not args.burst, out_dir, args)
+    finally:
+        if args.dir is None:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,159 @@
+"""Measure completed sessions/s as the number of `app.serve` workers grows.
+
+For each worker count the server is started via `python -m app.serve`. Load
+generator processes then open /ws/audio sessions in a closed loop: connect,
+stream a second of audio, ask the (mock) LLM one question, wait for the answer,
+and disconnect. Needs a reachable database and CR_LLM_PROVIDER=mock:
+
+    python -m bench.scaling_bench --workers 1 2 4 8 --concurrency 200 --seconds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+
+AUDIO_FRAME = b"\x00" * 1280  # 20 ms of f32le @ 16 kHz
+
+
+async def _one_session(url: str) -> None:
+    async with websockets.connect(url, max_size=None) as ws:
+        while json.loads(await ws.recv()).get("event") != "session.started":
+            pass
+        for _ in range(50):
+            await ws.send(AUDIO_FRAME)
+        await ws.send(json.dumps({"event": "client.text.message", "text": "summarize"}))
+        while json.loads(await ws.recv()).get("event") != "assistant.message.completed":
+            pass
+
+
+async def _client(url: str, concurrency: int, deadline: float) -> tuple[int, int]:
+    done = 0
+    failed = 0
+
+    async def loop() -> None:
+        nonlocal done, failed
+        while time.monotonic() < deadline:
+            try:
+                await _one_session(url)
+                done += 1
+            except Exception:
+                failed += 1
+                await asyncio.sleep(0.05)
+
+    await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return done, failed
+
+
+def _client_proc(url: str, concurrency: int, deadline: float, out: multiprocessing.Queue) -> None:
+    out.put(asyncio.run(_client(url, concurrency, deadline)))
+
+
+def _wait_ready(base: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base}/health/ready", timeout=1) as resp:
+                if resp.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+def _metrics(base: str) -> dict:
+    with urllib.request.urlopen(f"{base}/metrics", timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+def run(workers: int, args: argparse.Namespace) -> None:
+    cmd = [
+        sys.executable,
+        "-m",
+        "app.serve",
+        "--host",
+        args.host,
+        "--port",
+        str(args.port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+    ]
+    if args.db_budget:
+        cmd += ["--db-budget", str(args.db_budget)]
+    if args.uvloop:
+        cmd.append("--uvloop")
+    if args.pin_cpus:
+        cmd.append("--pin-cpus")
+
+    server = subprocess.Popen(cmd, env={**os.environ, "CR_LLM_PROVIDER": "mock"})
+    base = f"http://{args.host}:{args.port}"
+    try:
+        _wait_ready(base)
+        # Give every worker time to publish its first stats snapshot.
+        time.sleep(2)
+
+        url = f"ws://{args.host}:{args.port}/ws/audio"
+        per_proc = max(1, args.concurrency // args.client_procs)
+        deadline = time.monotonic() + args.seconds
+        out: multiprocessing.Queue = multiprocessing.Queue()
+        procs = [
+            multiprocessing.Process(target=_client_proc, args=(url, per_proc, deadline, out))
+            for _ in range(args.client_procs)
+        ]
+        t0 = time.monotonic()
+        for p in procs:
+            p.start()
+        results = [out.get() for _ in procs]
+        for p in procs:
+            p.join()
+        elapsed = time.monotonic() - t0
+
+        done = sum(r[0] for r in results)
+        failed = sum(r[1] for r in results)
+        totals = _metrics(base)["totals"]
+        rate = done / elapsed
+        print(
+            f"{workers:>7} {totals['workers']:>8} {rate:>10.1f} {rate / workers:>10.1f} "
+            f"{failed:>7} {totals['sessions_started']:>9}"
+        )
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--concurrency", type=int, default=200, help="open sessions in total")
+    parser.add_argument("--client-procs", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--db-budget", type=int, default=None)
+    parser.add_argument("--uvloop", action="store_true")
+    parser.add_argument("--pin-cpus", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'reported':>8} {'sess/s':>10} {'sess/s/wk':>10} {'failed':>7} {'started':>9}")
+    for n in args.workers:
+        run(n, args)
+
+
+if __name__ == "__main__":
+    main()
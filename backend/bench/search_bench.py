@@ -0,0 +1,138 @@
+"""Seed a synthetic message corpus and measure /search/conversations query latency.
+
+Usage (from backend/, against a scratch database):
+
+    CR_DATABASE_URL=postgresql+asyncpg://... python -m bench.search_bench --messages 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import func, insert, select
+
+from app.database import AsyncSessionMaker, engine
+from app.models import Base, Conversation, Message
+from app.services.search import search_conversations
+from migrations.add_message_search import migrate
+
+_VOCAB = (
+    "account billing refund invoice password reset login error timeout network "
+    "delivery order tracking shipment address payment card declined subscription "
+    "upgrade downgrade cancel plan trial support agent escalate ticket priority "
+    "latency audio microphone speaker echo noise transcript summary weather "
+    "calendar meeting schedule reminder travel flight hotel booking receipt"
+).split()
+
+_QUERIES = [
+    "refund",
+    "password reset",
+    "payment declined",
+    "flight booking",
+    "audio echo",
+    '"order tracking"',
+    "subscription -trial",
+    "escalate OR priority",
+]
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_VOCAB) for _ in range(rng.randint(6, 30)))
+
+
+async def seed(total_messages: int, per_conversation: int, batch_size: int, seed_value: int) -> None:
+    rng = random.Random(seed_value)
+    start = datetime.now(timezone.utc) - timedelta(days=30)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await migrate(batch_size=10_000, pause_s=0.0)
+
+    inserted = 0
+    t0 = time.perf_counter()
+    while inserted < total_messages:
+        convos: list[dict] = []
+        messages: list[dict] = []
+        while len(messages) < batch_size and inserted + len(messages) < total_messages:
+            convo_id = uuid4()
+            started_at = start + timedelta(seconds=rng.randint(0, 30 * 86400))
+            convos.append({"id": convo_id, "started_at": started_at, "ended_at": started_at})
+            for i in range(per_conversation):
+                messages.append(
+                    {
+                        "id": uuid4(),
+                        "conversation_id": convo_id,
+                        "role": "user" if i % 2 == 0 else "assistant",
+                        "content": _sentence(rng),
+                        "created_at": started_at + timedelta(seconds=i),
+                    }
+                )
+
+        async with engine.begin() as conn:
+            await conn.execute(insert(Conversation), convos)
+            await conn.execute(insert(Message), messages)
+        inserted += len(messages)
+        print(f"seeded {inserted}/{total_messages} messages", flush=True)
+
+    elapsed = time.perf_counter() - t0
+    print(f"seed: {inserted} messages in {elapsed:.1f}s ({inserted / elapsed:.0f} rows/s)")
+
+
+async def run_queries(iterations: int, limit: int, pages: int) -> None:
+    async with AsyncSessionMaker() as db:
+        total = await db.scalar(select(func.count()).select_from(Message))
+    print(f"corpus: {total} messages")
+    print(f"{'query':<24} {'page':>4} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'hits':>5}")
+
+    for query in _QUERIES:
+        cursor: str | None = None
+        for page_no in range(1, pages + 1):
+            samples: list[float] = []
+            hits = 0
+            next_cursor: str | None = None
+            for _ in range(iterations):
+                async with AsyncSessionMaker() as db:
+                    t0 = time.perf_counter()
+                    page = await search_conversations(db, query, limit=limit, cursor=cursor)
+                    samples.append((time.perf_counter() - t0) * 1000)
+                hits = len(page.hits)
+                next_cursor = page.next_cursor
+            samples.sort()
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            print(
+                f"{query:<24} {page_no:>4} {statistics.median(samples):>9.2f} "
+                f"{p95:>9.2f} {samples[-1]:>9.2f} {hits:>5}"
+            )
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--per-conversation", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--skip-seed", action="store_true", help="query an existing corpus")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=3)
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        await seed(args.messages, args.per_conversation, args.batch_size, args.seed)
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("ANALYZE messages")
+    await run_queries(args.iterations, args.limit, args.pages)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""One-off migration: add full-text search to an existing `messages` table.
+
+Safe to run against a live database and to re-run after interruption:
+
+    python -m migrations.add_message_search --batch-size 5000
+
+1. Add a nullable `search_vector` column (catalog-only change, no rewrite).
+2. Install the trigger that keeps it current for new and edited rows.
+3. Backfill existing rows in primary-key order, one small transaction per batch.
+4. Build the GIN index with CREATE INDEX CONCURRENTLY (no write lock).
+
+Tables created by the app's startup `create_all` already have all of this.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.models.message import SEARCH_CONFIG, SEARCH_TRIGGER_DDL
+
+
+async def migrate(batch_size: int, pause_s: float) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+        await conn.execute(
+            text("ALTER TABLE messages ADD COLUMN IF NOT EXISTS search_vector tsvector")
+        )
+        await conn.execute(
+            text("DROP TRIGGER IF EXISTS messages_search_vector_update ON messages")
+        )
+        await conn.execute(text(SEARCH_TRIGGER_DDL))
+    print("column and trigger installed", flush=True)
+
+    # Walk the primary key so every batch is an index range scan; filtering on
+    # `search_vector IS NULL` alone would rescan all rows already filled.
+    backfill = text(
+        "WITH batch AS ("
+        "  SELECT id FROM messages WHERE id > :last_id ORDER BY id LIMIT :batch"
+        "), filled AS ("
+        f"  UPDATE messages m SET search_vector = to_tsvector('{SEARCH_CONFIG}', m.content) "
+        "  FROM batch WHERE m.id = batch.id AND m.search_vector IS NULL RETURNING 1"
+        ") "
+        "SELECT (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_id, "
+        "(SELECT count(*) FROM filled) AS filled"
+    )
+    last_id = UUID(int=0)
+    total = 0
+    t0 = time.perf_counter()
+    while True:
+        async with engine.begin() as conn:
+            row = (await conn.execute(backfill, {"last_id": last_id, "batch": batch_size})).one()
+        if row.last_id is None:
+            break
+        last_id = row.last_id
+        total += row.filled
+        print(f"backfilled {total} rows ({total / (time.perf_counter() - t0):.0f} rows/s)", flush=True)
+        if pause_s:
+            await asyncio.sleep(pause_s)
+
+    # CONCURRENTLY cannot run inside a transaction block.
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        # A previous interrupted build leaves an INVALID index behind; rebuild it.
+        invalid = await conn.scalar(
+            text(
+                "SELECT NOT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = 'ix_messages_search_vector'"
+            )
+        )
+        if invalid:
+            await conn.execute(text("DROP INDEX CONCURRENTLY ix_messages_search_vector"))
+        await conn.execute(
+            text(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_search_vector "
+                "ON messages USING gin (search_vector)"
+            )
+        )
+    print("index ready", flush=True)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds to sleep between batches")
+    args = parser.parse_args()
+    await migrate(args.batch_size, args.pause)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+"""One-off migration: add `conversations.recording_path` to an existing table.
+
+    python -m migrations.add_recording_path
+
+A nullable column without a default is a catalog-only change, but ALTER TABLE
+still needs a brief ACCESS EXCLUSIVE lock; lock_timeout keeps it from queueing
+behind long transactions (re-run if it times out).
+
+Tables created by the app's startup `create_all` already have the column.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+async def migrate() -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+        await conn.execute(
+            text("ALTER TABLE conversations ADD COLUMN IF NOT EXISTS recording_path text")
+        )
+    print("conversations.recording_path ready", flush=True)
+
+
+async def main() -> None:
+    await migrate()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
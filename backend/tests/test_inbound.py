@@ -0,0 +1,78 @@
+import asyncio
+
+from app.services.inbound import BoundedQueue
+
+
+def _drain(q: BoundedQueue) -> list:
+    async def take() -> list:
+        return [await q.get() for _ in range(q.qsize())]
+
+    return asyncio.run(take())
+
+
+def test_offer_within_bounds_drops_nothing() -> None:
+    q: BoundedQueue[str] = BoundedQueue(2, "drop_newest")
+
+    assert q.offer("a") == []
+    assert q.offer("b") == []
+    assert q.dropped == 0
+
+
+def test_drop_newest_returns_the_offered_item() -> None:
+    q: BoundedQueue[str] = BoundedQueue(2, "drop_newest")
+    q.offer("a")
+    q.offer("b")
+
+    assert q.offer("c") == ["c"]
+    assert q.dropped == 1
+    assert _drain(q) == ["a", "b"]
+
+
+def test_drop_oldest_returns_the_evicted_item() -> None:
+    q: BoundedQueue[str] = BoundedQueue(2, "drop_oldest")
+    q.offer("a")
+    q.offer("b")
+
+    assert q.offer("c") == ["a"]
+    assert q.dropped == 1
+    assert _drain(q) == ["b", "c"]
+
+
+def test_byte_budget_evicts_as_many_as_needed() -> None:
+    q: BoundedQueue[bytes] = BoundedQueue(100, "drop_oldest", max_bytes=10)
+    q.offer(b"1234")
+    q.offer(b"5678")
+
+    assert q.offer(b"abcdefgh") == [b"1234", b"5678"]
+    assert q.queued_bytes == 8
+    assert q.dropped == 2
+
+
+def test_byte_budget_drop_newest_keeps_queue() -> None:
+    q: BoundedQueue[bytes] = BoundedQueue(100, "drop_newest", max_bytes=10)
+    q.offer(b"1234")
+
+    assert q.offer(b"abcdefgh") == [b"abcdefgh"]
+    assert q.queued_bytes == 4
+
+
+def test_item_larger_than_budget_is_rejected_without_evicting() -> None:
+    q: BoundedQueue[bytes] = BoundedQueue(100, "drop_oldest", max_bytes=10)
+    q.offer(b"1234")
+
+    assert q.offer(b"x" * 11) == [b"x" * 11]
+    assert _drain(q) == [b"1234"]
+
+
+def test_get_and_clear_release_bytes() -> None:
+    q: BoundedQueue[bytes] = BoundedQueue(100, "drop_oldest", max_bytes=10)
+    q.offer(b"1234")
+    q.offer(b"56")
+
+    assert _drain(q) == [b"1234", b"56"]
+    assert q.queued_bytes == 0
+
+    q.offer(b"789")
+    q.clear()
+    assert q.queued_bytes == 0
+    assert q.qsize() == 0
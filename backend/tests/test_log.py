@@ -0,0 +1,71 @@
+import json
+import logging
+
+import pytest
+
+from app import log
+from app.log import EventSampler, JSONFormatter
+
+
+def _record(event: str | None = None, level: int = logging.INFO) -> logging.LogRecord:
+    record = logging.LogRecord("t", level, __file__, 1, "msg", (), None)
+    if event is not None:
+        record.event = event
+    return record
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [100.0]
+    monkeypatch.setattr(log.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_rate_limit_refills_and_reports_suppressed(clock: list[float]) -> None:
+    sampler = EventSampler(sample_rates={}, rate_limits={"chat": 2.0})
+
+    assert [sampler.filter(_record("chat")) for _ in range(4)] == [True, True, False, False]
+
+    clock[0] += 0.5  # one token back at 2/s
+    record = _record("chat")
+    assert sampler.filter(record)
+    assert record.suppressed == 2
+
+    assert not sampler.filter(_record("chat"))
+
+
+def test_suppressed_is_only_set_when_something_was_dropped(clock: list[float]) -> None:
+    sampler = EventSampler(sample_rates={}, rate_limits={"chat": 5.0})
+    record = _record("chat")
+
+    assert sampler.filter(record)
+    assert not hasattr(record, "suppressed")
+
+
+def test_sampling_uses_rate_per_event(monkeypatch: pytest.MonkeyPatch) -> None:
+    draws = iter([0.05, 0.5, 0.09])
+    monkeypatch.setattr(log.random, "random", lambda: next(draws))
+    sampler = EventSampler(sample_rates={"chat": 0.1}, rate_limits={})
+
+    assert [sampler.filter(_record("chat")) for _ in range(3)] == [True, False, True]
+
+
+def test_untagged_records_and_warnings_bypass_sampling() -> None:
+    sampler = EventSampler(sample_rates={"chat": 0.0}, rate_limits={})
+
+    assert sampler.filter(_record())
+    assert sampler.filter(_record("chat", level=logging.WARNING))
+    assert not sampler.filter(_record("chat"))
+
+
+def test_json_formatter_includes_extras_but_not_color_message() -> None:
+    record = _record("chat")
+    record.conversation_id = "c1"
+    record.color_message = "\\x1b[32mmsg\\x1b[0m"
+
+    out = json.loads(JSONFormatter().format(record))
+
+    assert out["msg"] == "msg"
+    assert out["event"] == "chat"
+    assert out["conversation_id"] == "c1"
+    assert "color_message" not in out
@@ -0,0 +1,52 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.services.recorder import Recording
+
+
+def test_write_drops_once_queued_bytes_exceed_limit(tmp_path: Path) -> None:
+    async def scenario() -> Recording:
+        rec = await Recording.open(tmp_path / "a.wav", max_bytes=1024, write_bytes=4096)
+        # No await between writes, so the writer never gets to drain the queue.
+        for _ in range(3):
+            rec.write(b"\x00" * 400)
+        rec.write(b"\x00" * 4)
+        await rec.close()
+        return rec
+
+    rec = asyncio.run(scenario())
+
+    assert rec.bytes_written == 804
+    assert rec.dropped_bytes == 400
+
+
+def test_close_fixes_up_wav_header(tmp_path: Path) -> None:
+    path = tmp_path / "b.wav"
+
+    async def scenario() -> None:
+        rec = await Recording.open(path, max_bytes=1 << 20, write_bytes=1000)
+        for _ in range(10):
+            rec.write(b"\x00" * 1280)
+            await asyncio.sleep(0)
+        await rec.close()
+
+    asyncio.run(scenario())
+
+    data = path.read_bytes()
+    assert len(data) == 44 + 12800
+    assert int.from_bytes(data[4:8], "little") == 36 + 12800
+    assert int.from_bytes(data[40:44], "little") == 12800
+    assert int.from_bytes(data[20:22], "little") == 3  # IEEE float
+
+
+def test_open_failure_raises(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    async def scenario() -> None:
+        await Recording.open(blocker / "c.wav", max_bytes=1024, write_bytes=1024)
+
+    with pytest.raises(OSError):
+        asyncio.run(scenario())
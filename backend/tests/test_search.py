@@ -0,0 +1,68 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.search import router
+from app.config import settings
+from app.services.search import (
+    _START_SEL,
+    _STOP_SEL,
+    SearchError,
+    decode_cursor,
+    encode_cursor,
+    render_snippet,
+)
+
+
+def test_cursor_round_trip() -> None:
+    conversation_id = uuid4()
+    rank = 0.0607927106320858
+
+    cursor = encode_cursor(rank, conversation_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (rank, conversation_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", "e30", "eyJyIjogMX0"])
+def test_decode_cursor_rejects_garbage(cursor: str) -> None:
+    with pytest.raises(SearchError):
+        decode_cursor(cursor)
+
+
+def test_render_snippet_escapes_html_and_marks_hits() -> None:
+    headline = f"<img src=x onerror=alert(1)> {_START_SEL}refund{_STOP_SEL} & more"
+
+    assert render_snippet(headline) == (
+        "&lt;img src=x onerror=alert(1)&gt; <mark>refund</mark> &amp; more"
+    )
+
+
+def test_render_snippet_does_not_pass_through_literal_mark_tags() -> None:
+    assert render_snippet("<mark>x</mark>") == "&lt;mark&gt;x&lt;/mark&gt;"
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_search_requires_configured_token(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "admin_token", None)
+
+    assert client.get("/search/conversations", params={"q": "refund"}).status_code == 403
+
+
+def test_search_rejects_wrong_token(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "admin_token", "s3cret")
+
+    resp = client.get(
+        "/search/conversations",
+        params={"q": "refund"},
+        headers={"X-Admin-Token": "nope"},
+    )
+    assert resp.status_code == 401